@@ -7,10 +7,21 @@ import json
 import uuid
 from abc import ABC, abstractmethod
 import unicodedata
+from functools import lru_cache
 
 from pyldev import _config_logger
 
 
+@lru_cache(maxsize=4096)
+def _sanitize_line(cls: type, text: str) -> str:
+    """
+    Cached ``cls._sanitize``, for the short strings repeated across pages
+    (headers, footers, page numbers). Keyed by class, so that subclasses
+    overriding ``_sanitize`` get their own entries.
+    """
+    return cls._sanitize(text)
+
+
 class File(ABC):
 
     def __init__(self) -> None:
@@ -41,6 +52,13 @@ class File(ABC):
             return False
 
     def _sanitize_text(self, text: str) -> str:
+        # Long texts rarely repeat, and would crowd the cache
+        if len(text) <= 256:
+            return _sanitize_line(type(self), text)
+        return self._sanitize(text)
+
+    @staticmethod
+    def _sanitize(text: str) -> str:
         # Remove BOM if present
         text = text.lstrip("\ufeff")
 
@@ -1,5 +1,6 @@
+import sys
 from typing import Literal, Tuple, Union, Optional, List, Annotated, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 __all__ = [
     "FileElement",  # type hinting
@@ -8,12 +9,26 @@ __all__ = [
     "TableElement",
 ]
 
+# Metadata is never mutated after extraction: frozen models reject attribute
+# assignment. They are not all hashable, as TableMetadata holds a list of columns
+_METADATA_CONFIG = ConfigDict(frozen=True)
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    """
+    Interns low-cardinality metadata values (languages, formats), so that all the
+    elements of a file share the same string objects.
+    """
+    return sys.intern(value) if value else value
+
 
 class ImageMetadata(BaseModel):
     """
     Metadata for image elements produced by OCR on extracted images.
     """
 
+    model_config = _METADATA_CONFIG
+
     ocr_lang: Optional[str]
     image_format: Optional[str]
     image_dims: Optional[Tuple[int, int]]
@@ -24,6 +39,8 @@ class AudioMetadata(BaseModel):
     Metadata for audio extracts.
     """
 
+    model_config = _METADATA_CONFIG
+
     transcription_lang: str
     media_format: str
     sampling_frequency: int
@@ -34,6 +51,8 @@ class VideoMetadata(BaseModel):
     Metadata for video extracts.
     """
 
+    model_config = _METADATA_CONFIG
+
     transcription_lang: str
     media_format: str
     video_dims: Tuple[int, int]
@@ -44,6 +63,8 @@ class TextMetadata(BaseModel):
     Metadata for native text elements extracted from document sources.
     """
 
+    model_config = _METADATA_CONFIG
+
     bbox: Optional[Tuple[float, float, float, float]]
     ocr_lang: Optional[str]
     ocr_dpi: Optional[int]
@@ -54,6 +75,8 @@ class TableMetadata(BaseModel):
     Metadata for table elements extracted from native document sources.
     """
 
+    model_config = _METADATA_CONFIG
+
     columns: Optional[List[str]]
     bbox: Optional[Tuple[float, float, float, float]]
 
@@ -63,10 +86,14 @@ class ChunkMetadata(BaseModel):
     Metadata for chunk elements aggregated from different document sources.
     """
 
+    model_config = _METADATA_CONFIG
+
     ocr_lang: Optional[str]
 
 
 class FileMetadata(BaseModel):
+    model_config = _METADATA_CONFIG
+
     file_name: Optional[str]
     file_format: Optional[str]
     file_date: Optional[str]
@@ -134,11 +161,13 @@ class TextElement(Element):
             index=index,
             file=FileMetadata(
                 file_name=kwargs.get("file_name"),
-                file_format=kwargs.get("file_format"),
+                file_format=_intern(kwargs.get("file_format")),
                 file_author=kwargs.get("file_author"),
                 file_date=kwargs.get("file_date"),
             ),
-            metadata=TextMetadata(bbox=bbox, ocr_lang=ocr_lang, ocr_dpi=ocr_dpi),
+            metadata=TextMetadata(
+                bbox=bbox, ocr_lang=_intern(ocr_lang), ocr_dpi=ocr_dpi
+            ),
         )
 
     # Legacy / TODO: factories upgrade
@@ -191,7 +220,7 @@ class TableElement(Element):
             index=index,
             file=FileMetadata(
                 file_name=file_name,
-                file_format=file_format,
+                file_format=_intern(file_format),
                 file_author=file_author,
                 file_date=file_date,
             ),
@@ -222,13 +251,13 @@ class ImageElement(Element):
             index=index,
             file=FileMetadata(
                 file_name=file_name,
-                file_format=file_format,
+                file_format=_intern(file_format),
                 file_author=file_author,
                 file_date=file_date,
             ),
             metadata=ImageMetadata(
-                ocr_lang=ocr_lang,
-                image_format=image_format,
+                ocr_lang=_intern(ocr_lang),
+                image_format=_intern(image_format),
                 image_dims=image_dims,
             ),
         )
@@ -1,26 +1,374 @@
-from abc import ABC, abstractmethod
-import io
-from typing import Dict, List, Any, Optional, Union, Literal
-import json
-import sys, os
-from collections import defaultdict
-
-from ..element import FileElement, TextElement
+from abc import abstractmethod
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    MutableMapping,
+    Optional,
+    Literal,
+    Tuple,
+)
+import os
+import sys
+import math
+import multiprocessing
+import hashlib
+import importlib.util
+import shelve
+import tempfile
+from collections import OrderedDict, defaultdict, deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from functools import lru_cache, partial
+from itertools import chain, groupby, islice
+from operator import attrgetter
+
+import pytesseract
+from PIL import Image
+from pydantic import TypeAdapter
+
+if TYPE_CHECKING:
+    import tesserocr
+
+from pyldev import _config_logger
+from ..element import Element, FileElement, TextElement, ImageElement
 from ..File import File
 
 
+# Serializer of element lists, whose schema is built once. Typed on the common base:
+# every element class shares the base's ``type`` literal, which the ``FileElement``
+# discriminated union can't build a schema from.
+_ELEMENTS_ADAPTER = TypeAdapter(List[Element])
+
+
+# Persistent Tesseract handles of the current process, by (language, psm, oem).
+# tesserocr handles are not thread-safe: there must be one per process.
+_TESS_APIS: Dict[Tuple[str, int, int], "tesserocr.PyTessBaseAPI"] = {}
+
+
+@lru_cache(maxsize=None)
+def _has_tesserocr() -> bool:
+    """
+    Whether the optional ``tesserocr`` bindings, which keep Tesseract loaded
+    in-process, are installed. Checked without importing them.
+    """
+    return importlib.util.find_spec("tesserocr") is not None
+
+
+def _get_tess_api(
+    ocr_lang: str, ocr_psm: int, ocr_oem: int
+) -> Optional["tesserocr.PyTessBaseAPI"]:
+    """
+    Returns the persistent Tesseract handle for the given settings, or ``None`` when
+    ``tesserocr`` is not installed. ``tesserocr`` is only imported here, on first
+    use, as importing it loads libtesseract.
+    """
+    if not _has_tesserocr():
+        return None
+    key = (ocr_lang, ocr_psm, ocr_oem)
+    if key not in _TESS_APIS:
+        import tesserocr
+
+        _TESS_APIS[key] = tesserocr.PyTessBaseAPI(
+            lang=ocr_lang, psm=tesserocr.PSM(ocr_psm), oem=tesserocr.OEM(ocr_oem)
+        )
+    return _TESS_APIS[key]
+
+
+def _available_cpus() -> int:
+    """
+    The number of CPUs this process may run on, which unlike ``os.cpu_count`` accounts
+    for affinity masks and container CPU sets.
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0)) or 1
+    return os.cpu_count() or 1
+
+
+def _preprocess_image(image: Image.Image) -> Image.Image:
+    """
+    Prepares an image for OCR: transparency is flattened on a white background (as
+    transparent pixels are black once the alpha is dropped), then converted to
+    grayscale, which is what Tesseract works on.
+    """
+    if image.mode == "L":
+        return image
+
+    if "A" in image.getbands() or "transparency" in image.info:
+        image = image.convert("RGBA")
+        background = Image.new("RGB", image.size, "white")
+        background.paste(image, mask=image.getchannel("A"))
+        image = background
+
+    return image.convert("L")
+
+
+def _binarize_image(image: Image.Image) -> Image.Image:
+    """
+    Thresholds a grayscale image to black and white, with Otsu's method: the threshold
+    maximizing the variance between the two classes of the image's histogram.
+    """
+    histogram = image.histogram()[:256]
+    total = sum(histogram)
+    total_sum = sum(value * count for value, count in enumerate(histogram))
+
+    threshold, best_variance = 127, 0.0
+    back_count, back_sum = 0, 0
+    for value, count in enumerate(histogram):
+        back_count += count
+        fore_count = total - back_count
+        if back_count == 0:
+            continue
+        if fore_count == 0:
+            break
+        back_sum += value * count
+        back_mean = back_sum / back_count
+        fore_mean = (total_sum - back_sum) / fore_count
+        variance = back_count * fore_count * (back_mean - fore_mean) ** 2
+        if variance > best_variance:
+            threshold, best_variance = value, variance
+
+    # Lookup table, applied in a single pass over the pixels
+    return image.point([0 if value <= threshold else 255 for value in range(256)])
+
+
+def _image_entropy(image: Image.Image, size: int = 64) -> float:
+    """
+    Shannon entropy, in bits, of the grayscale levels of an image's ``size`` by
+    ``size`` thumbnail: close to 0 for flat fills, a couple of bits for text. The
+    thumbnail is preprocessed as for OCR, so that text drawn on a transparent
+    background is measured on white, as Tesseract reads it.
+    """
+    thumbnail = _preprocess_image(image.resize((size, size)))
+    total = size * size
+    return -sum(
+        count / total * math.log2(count / total)
+        for count in thumbnail.histogram()
+        if count
+    )
+
+
+def _image_to_string(
+    image: Image.Image, ocr_lang: str, ocr_psm: int = 3, ocr_oem: int = 1
+) -> str:
+    """
+    Reads the text of an image, through the persistent ``tesserocr`` handle when
+    available, else through a ``pytesseract`` subprocess.
+    """
+    image = _preprocess_image(image)
+    api = _get_tess_api(ocr_lang, ocr_psm, ocr_oem)
+    if api is None:
+        return pytesseract.image_to_string(
+            image, lang=ocr_lang, config=f"--oem {ocr_oem} --psm {ocr_psm}"
+        ).strip()
+    return _bytes_to_string(api, image.tobytes(), image.size)
+
+
+def _bytes_to_string(
+    api: "tesserocr.PyTessBaseAPI", data: bytes, size: Tuple[int, int]
+) -> str:
+    """
+    Reads the text of raw grayscale pixels. They are handed to Tesseract as they
+    are, where ``SetImage`` would encode them to an image file first.
+    """
+    width, height = size
+    api.SetImageBytes(data, width, height, 1, width)
+    return api.GetUTF8Text().strip()
+
+
+def _init_ocr_worker(ocr_lang: str, ocr_psm: int, ocr_oem: int) -> None:
+    """
+    Process pool initializer. Tesseract spawns its own OpenMP threads, which would
+    fight with the pool workers for the same cores: they are limited to one, in the
+    worker's environment, before libtesseract is loaded by ``_get_tess_api`` (OpenMP
+    reads the limit once, when loaded) and for the pytesseract subprocesses. The
+    language model is loaded upfront, once per worker.
+    """
+    os.environ["OMP_THREAD_LIMIT"] = "1"
+    _get_tess_api(ocr_lang, ocr_psm, ocr_oem)
+
+
+def _ocr_image(
+    image_data: Tuple[bytes, str, Tuple[int, int]],
+    ocr_lang: str,
+    ocr_psm: int,
+    ocr_oem: int,
+) -> str:
+    """
+    Rebuilds an image from its raw pixels and applies OCR on it.
+    Defined at module scope so it can be pickled to the pool workers.
+
+    Tesseract failures are raised as ``RuntimeError``, with the original message:
+    pytesseract's own exceptions can't be unpickled back from a worker.
+    """
+    data, mode, size = image_data
+    try:
+        api = _get_tess_api(ocr_lang, ocr_psm, ocr_oem)
+        if api is not None and mode == "L":
+            return _bytes_to_string(api, data, size)
+        image = Image.frombytes(mode, size, data)
+        return _image_to_string(image, ocr_lang, ocr_psm, ocr_oem)
+    except (pytesseract.TesseractError, RuntimeError, OSError) as e:
+        raise RuntimeError(str(e)) from None
+
+
+# Images read by a single Tesseract run. Longer lists keep more raw pixels in memory
+# and risk filling Tesseract's output pipe, for no further model load saved.
+_OCR_LIST_MAX_IMAGES = 50
+
+
+def _ocr_images(
+    images_data: List[Tuple[bytes, str, Tuple[int, int]]],
+    ocr_lang: str,
+    ocr_psm: int,
+    ocr_oem: int,
+) -> List[str]:
+    """
+    Applies OCR on several images with a single Tesseract run, given the list of their
+    files: the language model is loaded once for the whole batch.
+
+    Raises
+    ------
+    ValueError
+        When the output can't be split back into exactly one text per image.
+    pytesseract.TesseractError, OSError
+        When Tesseract or the temporary files failed.
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # Written one at a time, so the batch is never decoded at once
+        paths = []
+        for i, (data, mode, size) in enumerate(images_data):
+            path = os.path.join(tmp_dir, f"{i}.png")
+            with Image.frombytes(mode, size, data) as image:
+                image.save(path, format="PNG", compress_level=1)
+            paths.append(path)
+
+        # Tesseract reads a file which isn't an image as a list of images
+        list_path = os.path.join(tmp_dir, "images.txt")
+        with open(list_path, "w") as f:
+            f.write("\n".join(paths))
+
+        output = pytesseract.image_to_string(
+            list_path, lang=ocr_lang, config=f"--oem {ocr_oem} --psm {ocr_psm}"
+        )
+
+    # Tesseract ends every page with a form feed, so the last split is left empty.
+    # Any other count means a page was skipped or split, and texts would shift.
+    texts = output.split("\f")
+    if len(texts) != len(images_data) + 1:
+        raise ValueError(
+            f"Tesseract returned {len(texts) - 1} pages for {len(images_data)} images"
+        )
+    return [text.strip() for text in texts[:-1]]
+
+
+# In-memory OCR results kept per extractor, when not persisted. An entry is the text
+# of an image or a page, usually a few kilobytes.
+_OCR_CACHE_SIZE = 1024
+
+
+class _LRUCache(MutableMapping):
+    """
+    In-memory mapping which only keeps its ``maxsize`` most recently used entries.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._data: "OrderedDict[str, Any]" = OrderedDict()
+
+    def __getitem__(self, key: str) -> Any:
+        value = self._data[key]
+        self._data.move_to_end(key)
+        return value
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def __delitem__(self, key: str) -> None:
+        del self._data[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
 class FileExtractor(File):
 
-    def __init__(self) -> None:
+    def __init__(
+        self, logs_name: Optional[str] = None, cache_dir: Optional[str] = None
+    ) -> None:
+        """
+        Parameters
+        ----------
+        logs_name: Optional[str]
+            The name of the extractor logger. Defaults to the generic ``File`` logger.
+        cache_dir: Optional[str]
+            A folder where OCR results are persisted across runs. When ``None``,
+            only the ``_OCR_CACHE_SIZE`` most recent results are kept in memory.
+        """
         super().__init__()
 
+        if logs_name is not None:
+            self.logger = _config_logger(logs_name=logs_name)
+
+        # OCR results keyed by image content, so identical images are read once.
+        # Extractors may also store their own entries, under prefixed keys.
+        self._cache_dir = cache_dir
+        self._ocr_cache = self._open_ocr_cache()
+
+        # OCR process pool, kept across calls while the extractor is used as a context
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_config: Optional[Tuple[int, str, int, int]] = None
+        self._keep_pool = False
+
         self.SUPPORTED_FORMATS = {
-            "document": [".pdf", ".docx", ".doc", ".md", ".txt"],
+            "document": [".pdf", ".docx", ".doc", ".odt", ".md", ".txt"],
             "media": [".mp3", ".mp4"],
             "slideshow": [".pptx", ".otp"],
             "spreadsheet": [".xlsx", ".csv"],
         }
 
+    def __enter__(self):
+        """
+        Keeps the OCR processes alive until exit, so that a batch of files pays for
+        spawning them only once:
+
+        >>> with FileExtractorDocument() as extractor:
+        ...     for file_path in file_paths:
+        ...         extractor.extract(file_path)
+        """
+        if self._cache_dir is not None and not isinstance(
+            self._ocr_cache, shelve.Shelf
+        ):
+            # Reopened after a previous exit
+            self._ocr_cache = self._open_ocr_cache()
+        self._keep_pool = True
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Stops the OCR processes and closes the OCR cache persisted in ``cache_dir``,
+        if any. Called on exit of the context. The extractor can still be used
+        afterwards, with an in-memory cache until it is entered again.
+        """
+        self._keep_pool = False
+        self._shutdown_pool()
+        if isinstance(self._ocr_cache, shelve.Shelf):
+            self._ocr_cache.close()
+            self._ocr_cache = _LRUCache(_OCR_CACHE_SIZE)
+
     @abstractmethod
     def extract(self, *args, **kwargs):
         raise NotImplementedError
@@ -33,10 +381,11 @@ class FileExtractor(File):
         format: Literal["txt", "json"] = "txt",
     ):
         """
-        Save batches to disk. format="txt" writes a plain text file with blank-line separators.
+        Save batches to disk. format="txt" writes a plain text file per element with blank-line separators,
+        format="json" writes all the serialized elements into a single ``elements.json`` file.
         """
 
-        if not isinstance(elements, List):
+        if not isinstance(elements, list):
             elements = [elements]
 
         if file_name:
@@ -49,8 +398,10 @@ class FileExtractor(File):
             self.logger.warning("Missing file name when saving elements.")
             name = "_default"
 
-        if elements != []:
-            os.makedirs(os.path.join(output_path, name))
+        if not elements:
+            return output_path
+
+        os.makedirs(os.path.join(output_path, name))
 
         if format == "txt":
             for element in elements:
@@ -63,13 +414,10 @@ class FileExtractor(File):
             return output_path
 
         elif format == "json":
-            for element in elements:
-                with open(
-                    os.path.join(output_path, name, f"{element.index}.txt"),
-                    "w",
-                    encoding="utf-8",
-                ) as f:
-                    json.dump(element.content + "\n\n", f)
+            # Serialized by pydantic straight to UTF-8 bytes, as a single document
+            with open(os.path.join(output_path, name, "elements.json"), "wb") as f:
+                f.write(_ELEMENTS_ADAPTER.dump_json(elements))
+            return output_path
 
         return None
 
@@ -105,27 +453,29 @@ class FileExtractor(File):
         >>> [{content: 'SLIDE 1:\\n\\nhello world', index=1}, {content: 'SLIDE 2:\\n\\nAn other page', index=2}]
         """
 
-        # Sorts based on FileElement.index value
-        grouped_elements = defaultdict(list)
-        for element in elements:
-            index = element.index
-            if index is None:
-                continue
-            grouped_elements[index].append(element)
+        elements = [element for element in elements if element.index is not None]
+
+        # Extractors output elements sorted by index, which allows a single pass grouping
+        # of the consecutive elements with groupby
+        if all(a.index <= b.index for a, b in zip(elements, islice(elements, 1, None))):
+            grouped_elements = groupby(elements, key=attrgetter("index"))
+        else:
+            # Otherwise, elements are gathered by index, without sorting: groups are
+            # kept in the order their index first appears
+            groups = defaultdict(list)
+            for element in elements:
+                groups[element.index].append(element)
+            grouped_elements = groups.items()
+
+        # Header prefix is the same for every group
+        prefix = index_type.upper() if index_type is not None else None
 
         # Merges into same TextElement.content the grouped FileElement.content
         regrouped_elements = []
-        for elements in grouped_elements.values():
+        for index, group in grouped_elements:
 
-            index = elements[
-                0
-            ].index  # Retreive one of the element.index (they are all the same, because grouped by index)
-            content = (
-                f"{index_type.upper()} {index}:\n\n" if index_type is not None else ""
-            )
-
-            for element in elements:
-                content += element.content
+            header = f"{prefix} {index}:\n\n" if prefix is not None else ""
+            content = header + "".join(element.content for element in group)
 
             regrouped_elements.append(
                 TextElement(
@@ -136,3 +486,252 @@ class FileExtractor(File):
             )
 
         return regrouped_elements
+
+    def _ocr_cache_key(
+        self, image_bytes: bytes, ocr_lang: str, ocr_psm: int, ocr_oem: int
+    ) -> str:
+        """
+        Builds the OCR cache key of an image from its raw pixels and the OCR settings.
+        """
+        digest = hashlib.blake2b(image_bytes, digest_size=16).hexdigest()
+        return f"{digest}:{ocr_lang}:{ocr_psm}:{ocr_oem}"
+
+    def _open_ocr_cache(self) -> MutableMapping[str, Any]:
+        """
+        Opens the OCR cache, persisted in ``cache_dir`` when set.
+        """
+        if self._cache_dir is None:
+            return _LRUCache(_OCR_CACHE_SIZE)
+        os.makedirs(self._cache_dir, exist_ok=True)
+        return shelve.open(os.path.join(self._cache_dir, "ocr"))
+
+    def _sync_ocr_cache(self) -> None:
+        """
+        Flushes the OCR cache to disk, when persisted.
+        """
+        if isinstance(self._ocr_cache, shelve.Shelf):
+            self._ocr_cache.sync()
+
+    def _get_pool(
+        self, max_workers: int, ocr_lang: str, ocr_psm: int, ocr_oem: int
+    ) -> ProcessPoolExecutor:
+        """
+        Returns the OCR process pool, only respawned when its settings change.
+
+        Workers are started with the platform's default method. Only once tesserocr
+        has been loaded in this process are they spawned instead: a forked worker
+        would inherit libtesseract, loaded without the OpenMP thread limit. Spawned
+        workers re-import the caller's main module, whose entry point must then be
+        guarded by ``if __name__ == "__main__":``.
+        """
+        config = (max_workers, ocr_lang, ocr_psm, ocr_oem)
+        if self._pool is not None and self._pool_config != config:
+            self._shutdown_pool()
+
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=(
+                    multiprocessing.get_context("spawn")
+                    if "tesserocr" in sys.modules
+                    else None
+                ),
+                initializer=_init_ocr_worker,
+                initargs=(ocr_lang, ocr_psm, ocr_oem),
+            )
+            self._pool_config = config
+
+        return self._pool
+
+    def _shutdown_pool(self) -> None:
+        """
+        Stops the OCR processes, if any.
+        """
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+            self._pool_config = None
+
+    def _ocr_images_batch(
+        self,
+        images: Iterable[Tuple[int, Image.Image]],
+        ocr_lang: str,
+        ocr_psm: int = 3,
+        ocr_oem: int = 1,
+        image_format: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        binarize: bool = False,
+        keep_empty: bool = False,
+    ) -> List[ImageElement]:
+        """
+        Applies OCR on a batch of images, spread over a pool of processes.
+
+        Parameters
+        ----------
+        images: Iterable[Tuple[int, Image]]
+            The ``(index, image)`` pairs to read. The iterable is consumed lazily:
+            with a pool or tesserocr, a generator only keeps a couple of images per
+            worker in memory at once. Read sequentially without tesserocr, up to
+            ``_OCR_LIST_MAX_IMAGES`` uncached images are buffered, as raw pixels, for
+            a single Tesseract run. Each image is closed once its pixels are copied.
+        ocr_lang: str
+            Tesseract language code (e.g., 'eng', 'fra', 'eng+fra').
+        ocr_psm: int
+            Tesseract page segmentation mode.
+        ocr_oem: int
+            Tesseract OCR engine mode.
+        image_format: Optional[str]
+            The format of the source the images were extracted from.
+        max_workers: Optional[int]
+            The number of OCR processes. Defaults to the number of CPUs.
+        binarize: bool
+            Whether to threshold the images to black and white before OCR.
+        keep_empty: bool
+            Whether to also return the images where no text was found, with an
+            empty content, e.g. so that the caller can cache them.
+
+        Returns
+        -------
+        elements: List[ImageElement]
+            One ``ImageElement`` per image read (where some text was found, unless
+            ``keep_empty``), in input order.
+        """
+
+        max_workers = max_workers or _available_cpus()
+        ocr = partial(_ocr_image, ocr_lang=ocr_lang, ocr_psm=ocr_psm, ocr_oem=ocr_oem)
+
+        def _iter_images_data():
+            # Raw grayscale pixels are much cheaper to pickle than PIL objects,
+            # and the source images are closed as soon as their pixels are copied
+            for index, source in images:
+                try:
+                    image = _preprocess_image(source)
+                    if binarize:
+                        image = _binarize_image(image)
+                    data, mode, size = image.tobytes(), image.mode, image.size
+                    image.close()
+                except Exception as e:
+                    self.logger.error(f"Could not OCR page {index}: {e}")
+                    continue
+                finally:
+                    source.close()
+                key = self._ocr_cache_key(data, ocr_lang, ocr_psm, ocr_oem)
+                yield index, size, key, (data, mode, size)
+
+        def _read(future: Future, image_data) -> None:
+            # Errors are kept on the future, and reported with their page
+            try:
+                future.set_result(ocr(image_data))
+            except Exception as e:
+                future.set_exception(e)
+
+        def _submit(executor: Optional[Executor], key: str, image_data) -> Future:
+            future = Future()
+            text = self._ocr_cache.get(key)
+            if text is not None:
+                future.set_result(text)
+            elif executor is None:
+                _read(future, image_data)
+            else:
+                future = executor.submit(ocr, image_data)
+            return future
+
+        def _collect(index: int, image_dims: Tuple[int, int], key: str, future: Future):
+            try:
+                text = future.result()
+            except Exception as e:
+                self.logger.error(f"Could not OCR page {index}: {e}")
+                return
+            self._ocr_cache[key] = text
+            results.append((index, image_dims, text))
+
+        results: List[Tuple[int, Tuple[int, int], str]] = []
+        try:
+            images_data = _iter_images_data()
+            head = list(islice(images_data, 2))
+
+            # Spawning a pool costs more than it saves on a single image
+            if max_workers == 1 or len(head) < 2:
+                queued = []
+                # Without a persistent tesserocr handle, uncached images are read
+                # together by a single Tesseract run instead of one run each
+                batch: List[Tuple[Future, Tuple[bytes, str, Tuple[int, int]]]] = []
+
+                def _flush_batch():
+                    texts = None
+                    if len(batch) > 1:
+                        try:
+                            texts = _ocr_images(
+                                [image_data for _, image_data in batch],
+                                ocr_lang,
+                                ocr_psm,
+                                ocr_oem,
+                            )
+                        except (pytesseract.TesseractError, OSError, ValueError) as e:
+                            # Each image is read on its own instead, which reports
+                            # its own error
+                            self.logger.warning(
+                                f"Could not OCR {len(batch)} images at once, "
+                                f"reading them one at a time: {e}"
+                            )
+                    for i, (future, image_data) in enumerate(batch):
+                        if texts is None:
+                            _read(future, image_data)
+                        else:
+                            future.set_result(texts[i])
+                    batch.clear()
+
+                for index, image_dims, key, image_data in chain(head, images_data):
+                    if not _has_tesserocr() and key not in self._ocr_cache:
+                        future = Future()
+                        batch.append((future, image_data))
+                        if len(batch) >= _OCR_LIST_MAX_IMAGES:
+                            _flush_batch()
+                    else:
+                        future = _submit(None, key, image_data)
+                    queued.append((index, image_dims, key, future))
+
+                if batch:
+                    _flush_batch()
+
+                for args in queued:
+                    _collect(*args)
+            else:
+                executor = self._get_pool(max_workers, ocr_lang, ocr_psm, ocr_oem)
+                try:
+                    # Bounded window of submitted pages, collected in submission order
+                    pending = deque()
+                    for index, image_dims, key, image_data in chain(head, images_data):
+                        future = _submit(executor, key, image_data)
+                        pending.append((index, image_dims, key, future))
+                        if len(pending) >= 2 * max_workers:
+                            _collect(*pending.popleft())
+                    for args in pending:
+                        _collect(*args)
+                finally:
+                    if not self._keep_pool:
+                        self._shutdown_pool()
+        except Exception as e:
+            # Pages read so far are kept
+            self.logger.error(f"Batch OCR failed: {e}")
+        finally:
+            self._sync_ocr_cache()
+
+        elements: List[ImageElement] = []
+        for index, image_dims, text in results:
+            if not text and not keep_empty:
+                continue
+
+            self.logger.debug("Performed OCR on page %d.", index)
+            elements.append(
+                ImageElement(
+                    content=self._sanitize_text(text),
+                    index=index,
+                    source="ocr",
+                    ocr_lang=ocr_lang,
+                    image_format=image_format,
+                    image_dims=image_dims,
+                )
+            )
+
+        return elements
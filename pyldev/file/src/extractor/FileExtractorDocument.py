@@ -1,19 +1,33 @@
-from typing import List, Dict, Any, Optional, Union
-import pytesseract
+from typing import TYPE_CHECKING, Dict, Iterator, List, Literal, Optional, Tuple
 import os
-import sys
-import io
-import pandas as pd
+import hashlib
+import mmap
 import subprocess
-import shutil
-
-import pdfplumber
-from pdfplumber.page import Page
-import pypdfium2 as pdfium
-from pypdfium2 import PdfPage, PdfImage, PdfBitmap
-
-from pyldev import _config_logger
-from .FileExtractor import FileExtractor
+import tempfile
+from contextlib import ExitStack
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from itertools import groupby
+from operator import itemgetter
+from pathlib import Path
+
+from PIL import Image
+
+# The PDF libraries are imported on first use, so that importing the
+# extractors does not pay for them when no document is extracted
+if TYPE_CHECKING:
+    import pypdfium2 as pdfium
+    from pdfplumber.page import Page
+
+from .FileExtractor import (
+    FileExtractor,
+    _available_cpus,
+    _binarize_image,
+    _has_tesserocr,
+    _image_entropy,
+    _ocr_image,
+    _preprocess_image,
+)
 from ..element import TextElement, TableElement, ImageElement, FileElement
 
 
@@ -24,14 +38,26 @@ class FileExtractorDocument(FileExtractor):
 
     System dependencies:
     - tesseract-ocr: Required for OCR
+    - tesserocr: Optional, keeps Tesseract loaded in-process instead of one subprocess per image
     - libreoffice: Optional, only for .doc conversion
     """
 
+    # Extraction method by file extension, for the formats listed in
+    # SUPPORTED_FORMATS["document"]: the other ones are converted to PDF first
+    EXTRACTION_METHODS = {".pdf": "_extract_pdf"}
+
     def __init__(
         self,
         chunk_max_char: int = 1000,
         chunk_overlap: int = 100,
         ocr_lang: str = "eng",
+        ocr_psm: int = 3,
+        ocr_oem: int = 1,
+        ocr_dpi: int = 200,
+        ocr_binarize: bool = False,
+        text_engine: Literal["pdfplumber", "pdfium"] = "pdfplumber",
+        max_workers: Optional[int] = None,
+        cache_dir: Optional[str] = None,
     ):
         """
         Tool for text extraction from document-like files.
@@ -49,21 +75,59 @@ class FileExtractorDocument(FileExtractor):
             Character overlap between chunks
         ocr_lang:
             Tesseract language code (e.g., 'eng', 'fra', 'eng+fra')
+        ocr_psm:
+            Tesseract page segmentation mode. The default ``3`` runs the full automatic
+            layout analysis; ``6`` (single uniform block) or ``11`` (sparse text) are
+            much cheaper on forms and sparse scans.
+        ocr_oem:
+            Tesseract OCR engine mode, ``1`` being the LSTM engine only.
         ocr_dpi:
-            DPI for PDF to image conversion
+            Maximum DPI for PDF to image conversion. Scanned pages are rendered at
+            the resolution of their scan when it is lower, down to 150 DPI. The LSTM
+            engine gains little past 200 DPI on printed text, while the OCR time
+            grows with the number of pixels.
+        ocr_binarize:
+            Whether to threshold images to black and white before OCR. This saves
+            Tesseract its own thresholding on clean scans, but the LSTM engine reads
+            grayscale, so it may lose accuracy on noisy or low contrast images.
+        text_engine:
+            Library reading the native text of PDFs. ``'pdfplumber'`` groups words
+            from its own layout analysis. ``'pdfium'`` reads PDFium's text layer, many
+            times faster, only opening pdfplumber for the pages that may hold tables.
+        max_workers:
+            Number of processes used for OCR, and for the native extraction of PDFs
+            of 4 pages or more. Defaults to the available CPUs, up to 4, as Tesseract
+            gains little past a few workers.
+        cache_dir:
+            Folder where OCR results are persisted, so that re-extracting the same
+            images skips Tesseract, and the scanned pages of a known PDF are not even
+            rendered. Defaults to an in-memory cache of the most recent results.
 
         Notes
         -----
         - This class requires external dependencies for conversion:
             -
+        - Tesseract reads its models from ``TESSDATA_PREFIX``. Pointing it at the
+          ``tessdata_fast`` models instead of ``tessdata_best`` speeds up OCR several
+          times, for a small accuracy loss.
+        - With ``tesserocr`` installed, OCR processes are spawned once it has been
+          loaded in the calling process: scripts must then guard their entry point
+          with ``if __name__ == "__main__":``.
         """
-        super().__init__()
-
-        self.logger = _config_logger(logs_name="FileExtractorDocument")
+        super().__init__(logs_name="FileExtractorDocument", cache_dir=cache_dir)
 
         self.chunk_max_char = chunk_max_char
         self.chunk_overlap = chunk_overlap
         self.ocr_lang = ocr_lang
+        self.ocr_psm = ocr_psm
+        self.ocr_oem = ocr_oem
+        self.ocr_dpi = ocr_dpi
+        self.ocr_binarize = ocr_binarize
+        self.text_engine = text_engine
+        self.max_workers = max_workers or min(_available_cpus(), 4)
+
+        # LibreOffice profile used for conversions, removed with the extractor
+        self._soffice_profile: Optional[tempfile.TemporaryDirectory] = None
 
     def extract(self, file_path: str) -> List[FileElement]:
         """
@@ -84,33 +148,18 @@ class FileExtractorDocument(FileExtractor):
             self.logger.error(f"File not found: {file_path}")
             return []
 
-        if not self._check_supported(extractor_type="document", file_path=file_path):
-            return []
-
-        elements = []
-        if file_path.endswith(".pdf"):
-            self.logger.info(
-                f"Extracting from '{os.path.basename(file_path)}' using PDF methods."
+        extension = os.path.splitext(file_path)[-1].lower()
+        if extension not in self.SUPPORTED_FORMATS["document"]:
+            self.logger.warning(
+                f"Extractor 'document' does not support file '{extension}'."
             )
-            elements = self._extract_pdf(file_path=file_path)
-        else:
-            self.logger.info(
-                f"Extracting from '{os.path.basename(file_path)}' using PDF methods."
-            )
-            elements = self._extract_other(file_path=file_path)
-
-        # elif file_path.endswith(".docx"):
-        #     self.logger.info(
-        #         f"Extracting from '{os.path.basename(file_path)}' using DOCX methods."
-        #     )
-        #     elements = self._extract_docx(file_path=file_path)
-        # elif file_path.endswith(".odt") or file_path.endswith(".doc"):
-        #     self.logger.info(
-        #         f"Extracting from '{os.path.basename(file_path)}' using DOC/ODT methods."
-        #     )
-        #     elements = self._extract_doc(file_path=file_path)
+            return []
+        method_name = self.EXTRACTION_METHODS.get(extension, "_extract_other")
 
-        return elements
+        self.logger.info(
+            f"Extracting from '{os.path.basename(file_path)}' using '{method_name}'."
+        )
+        return getattr(self, method_name)(file_path=file_path)
 
     def _extract_pdf(
         self, file_path: str, text_threshold: int = 20
@@ -131,246 +180,682 @@ class FileExtractorDocument(FileExtractor):
             List of ``FileElement``.
         """
 
-        def _extract_text(page: Page, page_num: int) -> List[TextElement]:
-            """
-            Extract native text using pdfplumber with layout information.
-            """
-            elements: List[TextElement] = []
+        if not os.path.exists(file_path):
+            self.logger.error(f"PDF not found: {file_path}")
+            return []
 
-            try:
-                words = page.extract_words()
+        elements: List[FileElement] = []
 
-                if not words:
-                    return elements
+        # Scanned pages are only rasterized once all the pages are classified
+        scan_page_nums: List[int] = []
 
-                # Group words into text blocks by proximity
-                lines = {}
-                for word in words:
-                    y = round(word["top"])  # Round to group nearby words
-                    if y not in lines:
-                        lines[y] = []
-                    lines[y].append(word)
+        try:
 
-                # Sort lines by y-coordinate
-                for y in sorted(lines.keys()):
-                    line_words = sorted(lines[y], key=lambda w: w["x0"])
-                    text = " ".join([w["text"] for w in line_words]).strip()
+            import pypdfium2 as pdfium
 
-                    if not text:
-                        continue
+            # Opened from the path, PDFium only reads the parts of the file it needs
+            pdfium_pdf = pdfium.PdfDocument(file_path)
 
-                    # Calculate bounding box for the line
-                    x0 = min(w["x0"] for w in line_words)
-                    y0 = min(w["top"] for w in line_words)
-                    x1 = max(w["x1"] for w in line_words)
-                    y1 = max(w["bottom"] for w in line_words)
+            # The pool is shared by all the passes over the document
+            keep_pool, self._keep_pool = self._keep_pool, True
+            try:
+                # Pages without a text layer never reach pdfplumber
+                page_nums, scan_page_nums = self._classify_pdf_pages(
+                    pdfium_pdf, text_threshold
+                )
 
-                    self.logger.debug(f"Found native text from page {page_num}.")
-                    element = TextElement(
-                        content=self._sanitize_text(text),
-                        source="native",
-                        index=page_num,
-                        bbox=(float(x0), float(y0), float(x1), float(y1)),
+                # First pass: native extraction, scanned pages are set aside
+                if self.max_workers == 1 or len(page_nums) < 4:
+                    elements, native_scan_page_nums = self._extract_pdf_native(
+                        file_path, page_nums, text_threshold, pdf=pdfium_pdf
+                    )
+                    scan_page_nums.extend(native_scan_page_nums)
+                else:
+                    # pdfplumber is pure Python, so long documents are spread over
+                    # the OCR processes by ranges of pages, returned in order
+                    chunk_size = max(4, -(-len(page_nums) // (4 * self.max_workers)))
+                    executor = self._get_pool(
+                        self.max_workers, self.ocr_lang, self.ocr_psm, self.ocr_oem
+                    )
+                    worker = partial(
+                        _extract_pdf_pages,
+                        file_path=file_path,
+                        text_threshold=text_threshold,
+                        config=dict(
+                            ocr_lang=self.ocr_lang,
+                            ocr_psm=self.ocr_psm,
+                            ocr_oem=self.ocr_oem,
+                            ocr_dpi=self.ocr_dpi,
+                            ocr_binarize=self.ocr_binarize,
+                            text_engine=self.text_engine,
+                        ),
+                    )
+                    chunks = [
+                        page_nums[i : i + chunk_size]
+                        for i in range(0, len(page_nums), chunk_size)
+                    ]
+                    native_scan_page_nums = set()
+                    for chunk_elements, chunk_scan_page_nums in executor.map(
+                        worker, chunks
+                    ):
+                        elements.extend(chunk_elements)
+                        native_scan_page_nums.update(chunk_scan_page_nums)
+                    scan_page_nums.extend(native_scan_page_nums)
+
+                    # The workers leave the embedded images out: they are read here,
+                    # through this extractor's OCR cache and the same pool
+                    elements.extend(
+                        self._ocr_pdf_images(
+                            pdfium_pdf,
+                            [
+                                page_num
+                                for page_num in page_nums
+                                if page_num not in native_scan_page_nums
+                            ],
+                        )
                     )
-                    elements.append(element)
 
-            except Exception as e:
-                self.logger.warning(f"Error extracting text with pdfplumber: {e}")
+                # Second pass: only the scanned pages are rasterized for OCR, one at a time
+                scan_page_nums.sort()
+                page_keys = self._pdf_page_cache_keys(file_path, scan_page_nums)
 
-            return elements
+                # Pages read before are neither rendered nor read again
+                ocr_page_nums: List[int] = []
+                for page_num in scan_page_nums:
+                    cached = self._ocr_cache.get(page_keys[page_num])
+                    if cached is None:
+                        ocr_page_nums.append(page_num)
+                        continue
+                    content, image_dims = cached
+                    if not content:
+                        # A blank page, read before
+                        continue
+                    elements.append(
+                        ImageElement(
+                            content=content,
+                            index=page_num,
+                            source="ocr",
+                            ocr_lang=self.ocr_lang,
+                            image_format=".pdf",
+                            image_dims=image_dims,
+                        )
+                    )
 
-        def _extract_tables(page: Page, page_num: int) -> List[TableElement]:
-            """
-            Extract tables using pdfplumber's table detection.
-            """
-            elements: List[TableElement] = []
+                if self.max_workers == 1 or len(ocr_page_nums) < 2:
+                    scan_elements = self._ocr_images_batch(
+                        images=self._iter_pdf_scans(
+                            pdfium_pdf, ocr_page_nums, file_path
+                        ),
+                        ocr_lang=self.ocr_lang,
+                        ocr_psm=self.ocr_psm,
+                        ocr_oem=self.ocr_oem,
+                        image_format=".pdf",
+                        max_workers=1,
+                        binarize=self.ocr_binarize,
+                        keep_empty=True,
+                    )
+                else:
+                    scan_elements = self._ocr_pdf_scans(
+                        file_path, ocr_page_nums, keep_empty=True
+                    )
+                # Blank pages are cached too, so that they are not rendered again,
+                # but only the pages with some text are returned
+                for element in scan_elements:
+                    self._ocr_cache[page_keys[element.index]] = (
+                        element.content,
+                        element.metadata.image_dims,
+                    )
+                self._sync_ocr_cache()
+                elements.extend(element for element in scan_elements if element.content)
 
-            try:
-                tables = page.extract_tables()
+            finally:
+                pdfium_pdf.close()
+                self._keep_pool = keep_pool
+                if not self._keep_pool:
+                    self._shutdown_pool()
 
-                if not tables:
-                    return elements
+            # Restores the page order (sort is stable within a page)
+            elements.sort(key=lambda element: element.index)
 
-                for table_num, table_data in enumerate(tables):
-                    try:
-                        if not table_data or len(table_data) < 2:
-                            continue
+        except Exception as e:
+            self.logger.error(f"Error processing PDF {file_path}: {e}")
+            return []
 
-                        df = pd.DataFrame(table_data[1:], columns=table_data[0])
-                        text = df.to_string(index=False)
+        return elements
 
-                        self.logger.debug(f"Found native table from page {page_num}.")
+    def _pdf_page_cache_keys(
+        self, file_path: str, page_nums: List[int]
+    ) -> Dict[int, str]:
+        """
+        Builds the OCR cache keys of scanned pages, from the content of their PDF and
+        the rendering and OCR settings.
+        """
+        if not page_nums:
+            return {}
+
+        digest = hashlib.blake2b(digest_size=16)
+        with open(file_path, "rb") as f:
+            for block in iter(partial(f.read, 1 << 20), b""):
+                digest.update(block)
+
+        prefix = f"pdf:{digest.hexdigest()}"
+        settings = (
+            f"{self.ocr_lang}:{self.ocr_psm}:{self.ocr_oem}:"
+            f"{self.ocr_dpi}:{int(self.ocr_binarize)}"
+        )
+        return {
+            page_num: f"{prefix}:{page_num}:{settings}" for page_num in page_nums
+        }
+
+    def _classify_pdf_pages(
+        self, pdf: "pdfium.PdfDocument", text_threshold: int = 20
+    ) -> Tuple[List[int], List[int]]:
+        """
+        Sorts the pages of a PDF by whether they have a text layer, read with PDFium's
+        native text extraction, which is much cheaper than pdfplumber's layout parsing.
 
-                        element = TableElement(
-                            content=self._sanitize_text(text),
-                            source="native",
-                            index=page_num,
-                            columns=[str(col) for col in table_data[0]],
-                            bbox=None,
-                        )
-                        elements.append(element)
+        Returns
+        -------
+        page_nums: List[int]
+            The pages with at least ``text_threshold`` characters of text, starting at 1.
+        scan_page_nums: List[int]
+            The other pages, to be read by OCR.
+        """
+        page_nums: List[int] = []
+        scan_page_nums: List[int] = []
 
-                    except Exception as e:
-                        self.logger.warning(
-                            f"Could not extract table {table_num} on page {page_num}: {e}"
-                        )
+        for page_index in range(len(pdf)):
+            page = pdf.get_page(page_index)
+            textpage = page.get_textpage()
+            try:
+                has_native_text = _pdf_page_has_text(textpage, text_threshold)
+            finally:
+                textpage.close()
+                page.close()
 
-            except Exception as e:
-                self.logger.error(f"Table extraction failed on page {page_num}: {e}")
+            if has_native_text:
+                page_nums.append(page_index + 1)
+            else:
+                scan_page_nums.append(page_index + 1)
 
-            return elements
+        return page_nums, scan_page_nums
 
-        def _extract_images(page: pdfium.PdfPage, page_num: int) -> List[ImageElement]:
-            """
-            Extract embedded images and applies OCR.
-            """
+    def _extract_pdf_native(
+        self,
+        file_path: str,
+        page_nums: List[int],
+        text_threshold: int = 20,
+        pdf: Optional["pdfium.PdfDocument"] = None,
+        extract_images: bool = True,
+    ) -> Tuple[List[FileElement], List[int]]:
+        """
+        Extracts the native content of some pages of a PDF.
 
-            elements: List[ImageElement] = []
+        Parameters
+        ----------
+        file_path: str
+            Path to PDF file.
+        page_nums: List[int]
+            The pages to extract, starting at 1.
+        text_threshold: int
+            Minimum characters to consider page as having native text.
+        pdf: Optional[PdfDocument]
+            The PDF already opened with PDFium, if any. Otherwise the file is opened
+            for this call only, as in the pool workers.
+        extract_images: bool
+            Whether to OCR the embedded images of the pages.
 
-            try:
+        Returns
+        -------
+        elements: List[FileElement]
+            List of ``FileElement``.
+        scan_page_nums: List[int]
+            The pages without enough native text, left for OCR.
+        """
+        if not page_nums:
+            return [], []
 
-                page_objects = page.get_objects()
-
-                for obj_index, obj in enumerate(page_objects):
-                    try:
-                        if isinstance(obj, PdfImage):
-                            bitmap = obj.get_bitmap()
-                            pil_image = bitmap.to_pil()
-
-                            text = pytesseract.image_to_string(
-                                pil_image, lang=self.ocr_lang
-                            ).strip()
-
-                            if not text:
-                                continue
-
-                            self.logger.debug(
-                                f"Performed OCR on embedded image object {obj_index} from page {page_num}."
-                            )
-
-                            element = ImageElement(
-                                content=self._sanitize_text(text),
-                                index=page_num,
-                                source="ocr",
-                                ocr_lang=self.ocr_lang,
-                                image_dims=obj.get_px_size(),
-                            )
-                            elements.append(element)
-
-                    except Exception as e:
-                        self.logger.warning(
-                            f"Image extraction failed on page {page_num} for object {obj_index}: {e}"
+        import pdfplumber
+        import pypdfium2 as pdfium
+
+        elements: List[FileElement] = []
+        scan_page_nums: List[int] = []
+
+        with ExitStack() as stack:
+            pdfium_pdf = pdf
+            if pdfium_pdf is None:
+                pdfium_pdf = pdfium.PdfDocument(file_path)
+                stack.callback(pdfium_pdf.close)
+            plumber_pdf = None
+
+            def _get_plumber_page(page_num: int) -> "Page":
+                # Open with pdfplumber for better extraction, from a memory map of the
+                # file: pages are paged in by the OS as they are parsed, never copied
+                # whole. Only opened once a page needs it.
+                nonlocal plumber_pdf
+                if plumber_pdf is None:
+                    f = stack.enter_context(open(file_path, "rb"))
+                    pdf_map = stack.enter_context(
+                        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                    )
+                    plumber_pdf = stack.enter_context(pdfplumber.open(pdf_map))
+                return plumber_pdf.pages[page_num - 1]
+
+            for page_num in page_nums:
+                # pdfplumber index starts at 1
+                pdfium_page = pdfium_pdf.get_page(page_num - 1)
+
+                try:
+                    if self.text_engine == "pdfium":
+                        # The text layer was already checked by _classify_pdf_pages,
+                        # pdfplumber is only needed for the tables
+                        text_elements = self._extract_pdfium_text(pdfium_page, page_num)
+                        plumber_page = (
+                            _get_plumber_page(page_num)
+                            if _pdf_page_has_paths(pdfium_page)
+                            else None
                         )
+                    else:
+                        plumber_page = _get_plumber_page(page_num)
+
+                        # Check if page has native text, counting the parsed characters
+                        # first, then the words, which are reused below
+                        words = (
+                            plumber_page.extract_words()
+                            if len(plumber_page.chars) >= text_threshold
+                            else []
+                        )
+                        if sum(len(word["text"]) for word in words) < text_threshold:
+                            # Page is likely scanned - use OCR on entire page
+                            scan_page_nums.append(page_num)
+                            continue
 
-            except Exception as e:
-                self.logger.error(
-                    f"PDF loading page {page_num} failed before image extaction: {e}"
-                )
+                        text_elements = self._extract_pdf_text(
+                            plumber_page, page_num, words=words
+                        )
 
-            return elements
+                    self.logger.debug(
+                        "Extracting content from page %d.",
+                        page_num,
+                    )
 
-        def _extract_page(page: pdfium.PdfPage, page_num: int) -> List[ImageElement]:
-            """
-            Convert PDF page to image and apply OCR.
-            """
-            elements: List[ImageElement] = []
+                    # Extract text with layout
+                    elements.extend(text_elements)
 
-            try:
+                    # Extract tables
+                    if plumber_page is not None:
+                        table_elements = self._extract_pdf_tables(
+                            plumber_page, page_num
+                        )
+                        elements.extend(table_elements)
 
-                # Render page to bitmap
-                # scale: 1.0 = 72 DPI, 2.0 = 144 DPI, 4.0 = 288 DPI
-                bitmap: PdfBitmap = page.render(
-                    scale=4,
-                    rotation=0,
-                )
+                    # Extract images (limited functionality)
+                    if extract_images:
+                        image_elements = self._extract_pdf_images(
+                            pdfium_page, page_num
+                        )
+                        elements.extend(image_elements)
 
-                image = bitmap.to_pil()
+                finally:
+                    pdfium_page.close()
+
+        return elements, scan_page_nums
+
+    def _extract_pdf_text(
+        self, page: Optional["Page"], page_num: int, words: Optional[List[dict]] = None
+    ) -> List[TextElement]:
+        """
+        Extract native text using pdfplumber with layout information, from the
+        page's ``words`` when they were already extracted.
+        """
+        elements: List[TextElement] = []
+
+        try:
+            if words is None:
+                words = page.extract_words()
 
-                text = pytesseract.image_to_string(image, lang=self.ocr_lang).strip()
+            if not words:
+                return elements
+
+            # Group words into lines by proximity (rounded top), with a single sort
+            # in reading order after which each line is a contiguous run of words
+            keyed_words = sorted(
+                ((round(word["top"]), word["x0"], word) for word in words),
+                key=itemgetter(0, 1),
+            )
+            for _, line in groupby(keyed_words, key=itemgetter(0)):
+                line_words = [word for _, _, word in line]
+                text = " ".join([w["text"] for w in line_words]).strip()
 
                 if not text:
-                    return elements
+                    continue
+
+                # Calculate bounding box for the line, words are sorted by x0
+                x0 = line_words[0]["x0"]
+                y0 = min(w["top"] for w in line_words)
+                x1 = max(w["x1"] for w in line_words)
+                y1 = max(w["bottom"] for w in line_words)
 
-                self.logger.debug(f"Performed OCR on page {page_num}.")
-                element = ImageElement(
+                self.logger.debug("Found native text from page %d.", page_num)
+                element = TextElement(
                     content=self._sanitize_text(text),
+                    source="native",
                     index=page_num,
-                    source="ocr",
-                    ocr_lang=self.ocr_lang,
-                    image_format=".pdf",
-                    image_dims=(image.width, image.height),
+                    bbox=(float(x0), float(y0), float(x1), float(y1)),
                 )
                 elements.append(element)
 
-            except Exception as e:
-                self.logger.error(f"Could not OCR page {page_num}: {e}")
+        except Exception as e:
+            self.logger.warning(f"Error extracting text with pdfplumber: {e}")
 
-            return elements
+        return elements
 
-        # =====================
-        # PDF EXTRACTION LOGIC
-        # =====================
+    def _extract_pdfium_text(
+        self, page: "pdfium.PdfPage", page_num: int
+    ) -> List[TextElement]:
+        """
+        Extract native text from PDFium's text layer. Its runs of characters are
+        grouped into lines the same way as pdfplumber's words.
+        """
+        textpage = page.get_textpage()
 
-        if not os.path.exists(file_path):
-            self.logger.error(f"PDF not found: {file_path}")
+        try:
+            # PDFium's origin is the bottom left corner, pdfplumber's the top left
+            height = page.get_height()
+            words = []
+            for rect_index in range(textpage.count_rects()):
+                left, bottom, right, top = textpage.get_rect(rect_index)
+                text = textpage.get_text_bounded(left, bottom, right, top).strip()
+                if text:
+                    words.append(
+                        {
+                            "text": text,
+                            "x0": left,
+                            "x1": right,
+                            "top": height - top,
+                            "bottom": height - bottom,
+                        }
+                    )
+
+        except Exception as e:
+            self.logger.warning(f"Error extracting text with PDFium: {e}")
             return []
 
-        elements: List[FileElement] = []
+        finally:
+            textpage.close()
+
+        return self._extract_pdf_text(page=None, page_num=page_num, words=words)
+
+    def _extract_pdf_tables(
+        self, page: "Page", page_num: int
+    ) -> List[TableElement]:
+        """
+        Extract tables using pdfplumber's table detection.
+        """
+        elements: List[TableElement] = []
 
         try:
+            # Tables are detected from ruling lines (pdfplumber's default "lines"
+            # strategy), a page without any line, rect or curve cannot hold one
+            if not any(page.objects.get(kind) for kind in ("line", "rect", "curve")):
+                return elements
 
-            # Open as bytes to prevent concurring opening conflicts
-            with open(file_path, "rb") as f:
-                pdf_bytes = f.read()
+            # Same detection as extract_tables(), but keeping each table's position
+            tables = page.find_tables()
 
-            pdfium_pdf = pdfium.PdfDocument(file_path, autoclose=True)
+            if not tables:
+                return elements
 
-            # Open with pdfplumber for better extraction
-            with pdfplumber.open(io.BytesIO(pdf_bytes)) as plumber_pdf:
+            for table_num, table in enumerate(tables):
+                try:
+                    table_data = table.extract()
+                    if not table_data or len(table_data) < 2:
+                        continue
+
+                    # Tab separated rows, empty cells are read as None
+                    text = "\n".join(
+                        "\t".join("" if cell is None else str(cell) for cell in row)
+                        for row in table_data
+                    )
 
-                # This gets pdf plumber page
-                for page_num, plumber_page in enumerate(plumber_pdf.pages, start=1):
-                    # This gets pdfium page
-                    pdfium_page = pdfium_pdf.get_page(
-                        page_num - 1
-                    )  # pdfplumber index starts at 1
+                    self.logger.debug("Found native table from page %d.", page_num)
 
-                    # Check if page has native text
-                    native_text = plumber_page.extract_text()
-                    has_native_text = (
-                        native_text and len(native_text.strip()) >= text_threshold
+                    element = TableElement(
+                        content=self._sanitize_text(text),
+                        source="native",
+                        index=page_num,
+                        columns=[str(col) for col in table_data[0]],
+                        bbox=tuple(float(coord) for coord in table.bbox),
                     )
+                    elements.append(element)
 
-                    if has_native_text:
-                        self.logger.debug(
-                            f"Extracting content from '{os.path.basename(file_path)}' page {page_num}."
-                        )
+                except Exception as e:
+                    self.logger.warning(
+                        f"Could not extract table {table_num} on page {page_num}: {e}"
+                    )
 
-                        # Extract text with layout
-                        text_elements = _extract_text(plumber_page, page_num)
-                        elements.extend(text_elements)
+        except Exception as e:
+            self.logger.error(f"Table extraction failed on page {page_num}: {e}")
 
-                        # Extract tables
-                        table_elements = _extract_tables(plumber_page, page_num)
-                        elements.extend(table_elements)
+        return elements
 
-                        # Extract images (limited functionality)
-                        image_elements = _extract_images(pdfium_page, page_num)
-                        elements.extend(image_elements)
+    def _extract_pdf_images(
+        self,
+        page: "pdfium.PdfPage",
+        page_num: int,
+        min_image_size: int = 64,
+        min_entropy: float = 0.2,
+    ) -> List[ImageElement]:
+        """
+        Extract embedded images and applies OCR. Images smaller than
+        ``min_image_size`` squared pixels (bullets, icons) are skipped, as well as
+        near-uniform images (fills, blank placeholders) under ``min_entropy`` bits.
+        """
+        try:
+            # All the images of the page are read together, by a single Tesseract run
+            # when no persistent tesserocr handle is available
+            return self._ocr_images_batch(
+                images=self._iter_pdf_images(
+                    page, page_num, min_image_size, min_entropy
+                ),
+                ocr_lang=self.ocr_lang,
+                ocr_psm=self.ocr_psm,
+                ocr_oem=self.ocr_oem,
+                max_workers=1,
+                binarize=self.ocr_binarize,
+            )
 
-                    else:
-                        # Page is likely scanned - use OCR on entire page
-                        self.logger.debug(
-                            f"Performing OCR scan from '{os.path.basename(file_path)}' page {page_num}."
-                        )
-                        ocr_elements = _extract_page(pdfium_page, page_num)
-                        elements.extend(ocr_elements)
+        except Exception as e:
+            self.logger.error(
+                f"PDF loading page {page_num} failed before image extaction: {e}"
+            )
+
+        return []
+
+    def _iter_pdf_images(
+        self,
+        page: "pdfium.PdfPage",
+        page_num: int,
+        min_image_size: int = 64,
+        min_entropy: float = 0.2,
+    ) -> Iterator[Tuple[int, Image.Image]]:
+        """
+        Yields the ``(page_num, image)`` pairs of the embedded images of a page worth
+        reading, filtered as by ``_extract_pdf_images``.
+        """
+        from pypdfium2 import raw as pdfium_c
 
-            pdfium_pdf.close()
+        # Only image objects are enumerated, filtered by PDFium itself
+        images = page.get_objects(filter=[pdfium_c.FPDF_PAGEOBJ_IMAGE])
+        for obj_index, obj in enumerate(images):
+            try:
+                # Read from the image's metadata, before anything is decoded
+                width, height = obj.get_px_size()
+                if width * height < min_image_size**2:
+                    continue
+                bitmap = obj.get_bitmap()
+                image = bitmap.to_pil()
+                if _image_entropy(image) < min_entropy:
+                    image.close()
+                    continue
+            except Exception as e:
+                self.logger.warning(
+                    f"Image extraction failed on page {page_num} for object {obj_index}: {e}"
+                )
+                continue
+            # The bitmap is borrowed from the image object, and released with
+            # its page: only the PIL image is closed, by the OCR batch
+            yield page_num, image
+
+    def _ocr_pdf_images(
+        self, pdf: "pdfium.PdfDocument", page_nums: List[int]
+    ) -> List[ImageElement]:
+        """
+        Applies OCR on the embedded images of some pages of a PDF, spread over the
+        OCR processes. Used when the native content was extracted by pool workers.
+        """
+
+        def _iter_images():
+            for page_num in page_nums:
+                page = pdf.get_page(page_num - 1)
+                try:
+                    # The pixels are copied by the OCR batch as they are pulled,
+                    # before the page is released
+                    yield from self._iter_pdf_images(page, page_num)
+                finally:
+                    page.close()
+
+        return self._ocr_images_batch(
+            images=_iter_images(),
+            ocr_lang=self.ocr_lang,
+            ocr_psm=self.ocr_psm,
+            ocr_oem=self.ocr_oem,
+            max_workers=self.max_workers,
+            binarize=self.ocr_binarize,
+        )
+
+    def _render_pdf_page(
+        self, page: "pdfium.PdfPage", page_num: int
+    ) -> Optional[Image.Image]:
+        """
+        Convert PDF page to image, to be read by OCR.
+        """
+
+        try:
+
+            # Render page to bitmap, in grayscale as read by Tesseract
+            # scale: 1.0 = 72 DPI, 2.0 = 144 DPI, 4.0 = 288 DPI
+            bitmap = page.render(
+                scale=_pdf_render_dpi(page, self.ocr_dpi) / 72,
+                rotation=0,
+                grayscale=True,
+            )
+
+            return bitmap.to_pil()
 
         except Exception as e:
-            self.logger.error(f"Error processing PDF {file_path}: {e}")
-            return []
+            self.logger.error(f"Could not render page {page_num}: {e}")
+
+        return None
+
+    def _iter_pdf_scans(
+        self,
+        pdf: "pdfium.PdfDocument",
+        page_nums: List[int],
+        file_path: str,
+    ) -> Iterator[Tuple[int, Image.Image]]:
+        """
+        Lazily renders the scanned pages, so only the pages waiting for OCR are
+        held in memory. With tesserocr, the next page is rendered by a thread while
+        the current one is read. Without it, pages are read by batches of
+        ``_OCR_LIST_MAX_IMAGES`` only once all of them are rendered, so rendering
+        ahead can't overlap the OCR: pages are rendered as they are pulled instead.
+        """
+        file_name = os.path.basename(file_path)
+
+        def _render(page_num: int) -> Optional[Image.Image]:
+            self.logger.debug(
+                "Performing OCR scan from '%s' page %d.",
+                file_name,
+                page_num,
+            )
+            page = pdf.get_page(page_num - 1)
+            try:
+                return self._render_pdf_page(page, page_num)
+            finally:
+                page.close()
+
+        if len(page_nums) < 2 or not _has_tesserocr():
+            for page_num in page_nums:
+                image = _render(page_num)
+                if image is not None:
+                    yield page_num, image
+            return
+
+        # Double buffering: PDFium (through ctypes) and Tesseract both release the
+        # GIL, and only this thread touches the document meanwhile
+        with ThreadPoolExecutor(max_workers=1) as renderer:
+            pending = renderer.submit(_render, page_nums[0])
+            for index, page_num in enumerate(page_nums):
+                image = pending.result()
+                if index + 1 < len(page_nums):
+                    pending = renderer.submit(_render, page_nums[index + 1])
+                if image is not None:
+                    yield page_num, image
+
+    def _ocr_pdf_scans(
+        self, file_path: str, page_nums: List[int], keep_empty: bool = False
+    ) -> List[ImageElement]:
+        """
+        Renders and reads the scanned pages in the pool processes, a page per task:
+        only its text is sent back, never its pixels. Blank pages are only returned,
+        with an empty content, when ``keep_empty``.
+        """
+        file_name = os.path.basename(file_path)
+
+        # PDFium is not thread safe, each process renders from its own document
+        executor = self._get_pool(
+            self.max_workers, self.ocr_lang, self.ocr_psm, self.ocr_oem
+        )
+        ocr = partial(
+            _ocr_pdf_scan,
+            file_path,
+            ocr_dpi=self.ocr_dpi,
+            ocr_lang=self.ocr_lang,
+            ocr_psm=self.ocr_psm,
+            ocr_oem=self.ocr_oem,
+            binarize=self.ocr_binarize,
+        )
+        futures: List[Tuple[int, Future]] = []
+        for page_num in page_nums:
+            self.logger.debug(
+                "Performing OCR scan from '%s' page %d.",
+                file_name,
+                page_num,
+            )
+            futures.append((page_num, executor.submit(ocr, page_num)))
+
+        elements: List[ImageElement] = []
+        for page_num, future in futures:
+            try:
+                text, image_dims = future.result()
+            except Exception as e:
+                self.logger.error(f"Could not OCR page {page_num}: {e}")
+                continue
+            if not text and not keep_empty:
+                continue
+
+            self.logger.debug("Performed OCR on page %d.", page_num)
+            elements.append(
+                ImageElement(
+                    content=self._sanitize_text(text),
+                    index=page_num,
+                    source="ocr",
+                    ocr_lang=self.ocr_lang,
+                    image_format=".pdf",
+                    image_dims=image_dims,
+                )
+            )
 
         return elements
 
@@ -395,9 +880,20 @@ class FileExtractorDocument(FileExtractor):
             self.logger.error("LibreOffice (soffice/libreoffice) not found on PATH")
             return []
 
+        # A profile of our own, created by the first conversion and reused by the next
+        # ones, which then skip LibreOffice's first start initialization. It also keeps
+        # concurrent extractors off the lock of the user's default profile.
+        if self._soffice_profile is None:
+            self._soffice_profile = tempfile.TemporaryDirectory(
+                prefix="pyldev_soffice_"
+            )
+        profile_uri = Path(self._soffice_profile.name).as_uri()
+
         cmd = [
             soffice_bin,
+            f"-env:UserInstallation={profile_uri}",
             "--headless",
+            "--norestore",
             "--convert-to",
             "pdf",
             "--outdir",
@@ -422,3 +918,125 @@ class FileExtractorDocument(FileExtractor):
             return []
 
         return self._extract_pdf(file_path=pdf_path)
+
+
+def _pdf_render_dpi(
+    page: "pdfium.PdfPage", max_dpi: int, min_dpi: int = 150
+) -> int:
+    """
+    Rendering a scanned page past the resolution of its scan only adds pixels for
+    Tesseract to read, so the DPI follows the page's largest image, clamped between
+    ``min_dpi`` and ``max_dpi``.
+    """
+    import pypdfium2 as pdfium
+    from pypdfium2 import raw as pdfium_c
+
+    dpi = max_dpi
+
+    try:
+        largest_area = 0.0
+        for obj in page.get_objects(filter=[pdfium_c.FPDF_PAGEOBJ_IMAGE]):
+            # Named get_pos() up to pypdfium2 v4
+            get_bounds = getattr(obj, "get_bounds", None) or obj.get_pos
+            left, bottom, right, top = get_bounds()
+            area = (right - left) * (top - bottom)
+            if right > left and area > largest_area:
+                largest_area = area
+                # Positions are in points, 72 per inch
+                dpi = obj.get_px_size()[0] * 72 / (right - left)
+
+    except pdfium.PdfiumError:
+        # Unreadable image objects are left to the renderer, at the maximum DPI
+        dpi = max_dpi
+
+    return int(max(min_dpi, min(max_dpi, dpi)))
+
+
+def _pdf_page_has_text(textpage: "pdfium.PdfTextPage", text_threshold: int) -> bool:
+    """
+    Whether a page's text layer holds at least ``text_threshold`` characters other
+    than whitespace. Characters are read one at a time, only until the threshold is
+    met, instead of decoding the whole page's text.
+    """
+    from pypdfium2 import raw as pdfium_c
+
+    char_count = textpage.count_chars()
+    if char_count < text_threshold:
+        return False
+
+    found = 0
+    for index in range(char_count):
+        if not chr(pdfium_c.FPDFText_GetUnicode(textpage.raw, index)).isspace():
+            found += 1
+            if found >= text_threshold:
+                return True
+    return False
+
+
+def _pdf_page_has_paths(page: "pdfium.PdfPage") -> bool:
+    """
+    Whether a page draws any path, which tables are detected from.
+    """
+    from pypdfium2 import raw as pdfium_c
+
+    paths = page.get_objects(filter=[pdfium_c.FPDF_PAGEOBJ_PATH])
+    return next(paths, None) is not None
+
+
+def _ocr_pdf_scan(
+    file_path: str,
+    page_num: int,
+    ocr_dpi: int,
+    ocr_lang: str,
+    ocr_psm: int,
+    ocr_oem: int,
+    binarize: bool,
+) -> Tuple[str, Tuple[int, int]]:
+    """
+    Pool worker rendering a scanned page of a PDF and reading it, in the same
+    process. Returns the page's text and the dimensions it was read at.
+    """
+    import pypdfium2 as pdfium
+
+    pdf = pdfium.PdfDocument(file_path)
+    try:
+        page = pdf.get_page(page_num - 1)
+        try:
+            # Rendered in grayscale, as read by Tesseract
+            bitmap = page.render(
+                scale=_pdf_render_dpi(page, ocr_dpi) / 72,
+                rotation=0,
+                grayscale=True,
+            )
+            image = _preprocess_image(bitmap.to_pil())
+            if binarize:
+                image = _binarize_image(image)
+            image_data = (image.tobytes(), image.mode, image.size)
+        finally:
+            page.close()
+    finally:
+        pdf.close()
+
+    return _ocr_image(image_data, ocr_lang, ocr_psm, ocr_oem), image.size
+
+
+# Extractors of the pool processes, kept across the tasks they are sent
+_WORKER_EXTRACTORS: Dict[Tuple, "FileExtractorDocument"] = {}
+
+
+def _extract_pdf_pages(
+    page_nums: List[int], file_path: str, text_threshold: int, config: Dict
+) -> Tuple[List[FileElement], List[int]]:
+    """
+    Pool worker extracting the native content of a range of pages of a PDF.
+    """
+    key = tuple(sorted(config.items()))
+    extractor = _WORKER_EXTRACTORS.get(key)
+    if extractor is None:
+        extractor = FileExtractorDocument(**config, max_workers=1)
+        _WORKER_EXTRACTORS[key] = extractor
+
+    # Embedded images are left to the parent, which reads them through its OCR cache
+    return extractor._extract_pdf_native(
+        file_path, page_nums, text_threshold, extract_images=False
+    )
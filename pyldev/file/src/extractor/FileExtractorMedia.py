@@ -1,5 +1,4 @@
-from abc import ABC
-from typing import Optional, Union
+from typing import Optional
 from io import BytesIO
 
 from .FileExtractor import FileExtractor
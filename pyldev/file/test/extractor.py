@@ -14,59 +14,64 @@ os.environ["LOGS_LEVEL"] = "INFO"
 # os.environ["LOGS_DIR"] = os.path.dirname(__file__)
 os.environ["LOGS_OUTPUT"] = "file, console"
 
-output_dir = os.path.join(MAIN_DIR, "file", "test", "outputs")
-os.makedirs(output_dir, exist_ok=True)
-for dir in [os.path.join(output_dir, dir) for dir in os.listdir(output_dir)]:
-    for file in [os.path.join(dir, file) for file in os.listdir(dir)]:
-        os.remove(file)
-    os.removedirs(dir)
-
-files = [
-    os.path.join(os.path.dirname(__file__), "files", file)
-    for file in os.listdir(os.path.join(os.path.dirname(__file__), "files"))
-    if not file.endswith(".gitignore")
-]  # test files in /files folder
-
-extractor_document = (
-    FileExtractorDocument()
-)  # cache_dir=os.path.join(os.path.dirname(__file__), "test"))
-# extractor_document.logger = pyldev._config_logger(
-#     logs_name="ExtractorTests",
-#     logs_output=["console", "file"],
-#     # logs_level="DEBUG",
-# )
-
-extractor_slideshow = FileExtractorSlideshow()
-
-for file in tqdm(files):
-
-    try:
-
-        elements = extractor_document.extract(file_path=file)
-        # print(elements)
-        # import pprint
-        # pprint.pprint(elements)
-        # sys.exit()
-        # continue
-
-        elements = extractor_document._group_elements(elements=elements)
-        extractor_document.file_path = file
-
-        extractor_document._save_elements(
-            output_path=output_dir,
-            elements=elements,
-            format="txt",
-        )
-
-        # elements = extractor_slideshow.extract(file_path=file)
-        # extractor_slideshow.file_path = file
-
-        # extractor_slideshow._save_elements(
-        #     output_path=output_dir,
-        #     elements=elements,
-        #     format="txt",
-        # )
-
-    except Exception as e:
-        print(str(e))
-        print(f"EXTRACTOR ERROR: {e}")
+# Guarded, as the OCR process pool re-imports this module on spawn platforms
+if __name__ == "__main__":
+
+    output_dir = os.path.join(MAIN_DIR, "file", "test", "outputs")
+    os.makedirs(output_dir, exist_ok=True)
+    for dir in [os.path.join(output_dir, dir) for dir in os.listdir(output_dir)]:
+        for file in [os.path.join(dir, file) for file in os.listdir(dir)]:
+            os.remove(file)
+        os.removedirs(dir)
+
+    files = [
+        os.path.join(os.path.dirname(__file__), "files", file)
+        for file in os.listdir(os.path.join(os.path.dirname(__file__), "files"))
+        if not file.endswith(".gitignore")
+    ]  # test files in /files folder
+
+    extractor_document = (
+        FileExtractorDocument()
+    )  # cache_dir=os.path.join(os.path.dirname(__file__), "test"))
+    # extractor_document.logger = pyldev._config_logger(
+    #     logs_name="ExtractorTests",
+    #     logs_output=["console", "file"],
+    #     # logs_level="DEBUG",
+    # )
+
+    extractor_slideshow = FileExtractorSlideshow()
+
+    # Shares the OCR processes across all the test files
+    with extractor_document:
+        for file in tqdm(files):
+
+            try:
+
+                elements = extractor_document.extract(file_path=file)
+                # print(elements)
+                # import pprint
+                # pprint.pprint(elements)
+                # sys.exit()
+                # continue
+
+                elements = extractor_document._group_elements(elements=elements)
+                extractor_document.file_path = file
+
+                extractor_document._save_elements(
+                    output_path=output_dir,
+                    elements=elements,
+                    format="txt",
+                )
+
+                # elements = extractor_slideshow.extract(file_path=file)
+                # extractor_slideshow.file_path = file
+
+                # extractor_slideshow._save_elements(
+                #     output_path=output_dir,
+                #     elements=elements,
+                #     format="txt",
+                # )
+
+            except Exception as e:
+                print(str(e))
+                print(f"EXTRACTOR ERROR: {e}")
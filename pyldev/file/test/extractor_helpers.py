@@ -0,0 +1,674 @@
+import os, sys
+import shutil
+import tempfile
+import logging
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+MAIN_DIR = os.path.dirname(os.path.dirname((os.path.dirname(__file__))))
+if __name__ == "__main__":
+    sys.path.append(MAIN_DIR)
+
+from PIL import Image, ImageDraw
+
+from file import *
+from file.src.extractor import FileExtractor as extractor_module
+from file.src.extractor import FileExtractorDocument as document_module
+
+os.environ["LOGS_LEVEL"] = "INFO"
+os.environ["LOGS_OUTPUT"] = "console"
+
+# Unit tests of the extractors' helpers. With ``pyldev`` installed (``pip install -e .``),
+# run as a script, or with ``python -m pytest file/test/extractor_helpers.py`` from the
+# ``pyldev`` folder.
+
+TESSERACT = shutil.which("tesseract")
+
+
+class _Records(logging.Handler):
+    """
+    Keeps the messages logged by an extractor.
+    """
+
+    def __init__(self, logger: logging.Logger) -> None:
+        super().__init__()
+        self.messages = []
+        logger.addHandler(self)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.messages.append(record.getMessage())
+
+
+def _text_image(text: str, size=(300, 80)) -> Image.Image:
+    image = Image.new("L", size, 255)
+    ImageDraw.Draw(image).text((10, 30), text, fill=0)
+    return image
+
+
+def _scan_pdf(path: str, pages: int = 1, image_width: int = 600) -> str:
+    """
+    A PDF of full page images, without any text layer.
+    """
+    from reportlab.pdfgen import canvas
+
+    pdf = canvas.Canvas(path)
+    for page_num in range(1, pages + 1):
+        image_path = os.path.join(os.path.dirname(path), f"scan_{page_num}.png")
+        image = _text_image(f"Scanned page {page_num}", size=(600, 800))
+        image.resize((image_width, image_width * 4 // 3)).save(image_path)
+        pdf.drawImage(image_path, 0, 0, width=595, height=842)
+        pdf.showPage()
+    pdf.save()
+    return path
+
+
+def _text_pdf(path: str, pages: int = 1, images: bool = True) -> str:
+    """
+    A PDF with a text layer, and a distinct embedded figure on each page.
+    """
+    from reportlab.pdfgen import canvas
+
+    pdf = canvas.Canvas(path)
+    for page_num in range(1, pages + 1):
+        pdf.drawString(72, 760, f"Native text of page {page_num}, long enough to be kept.")
+        if images:
+            image_path = os.path.join(os.path.dirname(path), f"figure_{page_num}.png")
+            image = _text_image(f"Figure {page_num}", size=(200, 200))
+            ImageDraw.Draw(image).rectangle((0, 100, 199, 199), fill=0)
+            image.save(image_path)
+            pdf.drawImage(image_path, 72, 400, width=200, height=200)
+        pdf.showPage()
+    pdf.save()
+    return path
+
+
+# OCR BATCHES
+
+
+def test_ocr_images_batch_pool():
+    extractor = FileExtractorDocument()
+    images = ((index, _text_image(f"image {index}")) for index in range(1, 8))
+
+    def _ocr_image(image_data, **kwargs):
+        return f"{image_data[2][0]} wide"
+
+    # Threads stand in for the processes, so that the patched OCR is shared
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        with mock.patch.object(extractor, "_get_pool", return_value=executor):
+            with mock.patch.object(extractor_module, "_ocr_image", _ocr_image):
+                elements = extractor._ocr_images_batch(images, "eng", max_workers=2)
+
+    # Collected in input order, whatever order the workers finish in
+    assert [element.index for element in elements] == list(range(1, 8))
+    assert elements[0].content == "300 wide"
+    assert elements[0].metadata.image_dims == (300, 80)
+
+
+def test_ocr_images_split():
+    images_data = [
+        (image.tobytes(), image.mode, image.size)
+        for image in (_text_image("first"), _text_image("second"))
+    ]
+    pytesseract = extractor_module.pytesseract
+
+    with mock.patch.object(
+        pytesseract, "image_to_string", return_value="first\n\fsecond\n\f"
+    ):
+        texts = extractor_module._ocr_images(images_data, "eng", 3, 1)
+    assert texts == ["first", "second"]
+
+    # A page more or less would shift the texts: the batch is rejected
+    for output in ("first second\f", "first\fsec\fond\f"):
+        with mock.patch.object(pytesseract, "image_to_string", return_value=output):
+            try:
+                extractor_module._ocr_images(images_data, "eng", 3, 1)
+            except ValueError:
+                continue
+        raise AssertionError(f"{output!r} was split")
+
+
+def test_ocr_images_fallback():
+    extractor = FileExtractorDocument()
+    records = _Records(extractor.logger)
+    images = [(index, _text_image(f"image {index}")) for index in (1, 2)]
+
+    def _ocr_image(image_data, **kwargs):
+        return f"{image_data[2][0]} wide"
+
+    with mock.patch.object(
+        extractor_module, "_ocr_images", side_effect=ValueError("shifted")
+    ), mock.patch.object(extractor_module, "_ocr_image", _ocr_image), \
+            mock.patch.object(extractor_module, "_has_tesserocr", return_value=False):
+        elements = extractor._ocr_images_batch(images, "eng", max_workers=1)
+
+    # The failure is logged, then each image is read on its own
+    assert any("shifted" in message for message in records.messages)
+    assert [element.content for element in elements] == ["300 wide", "300 wide"]
+
+
+def test_ocr_images_list_batches():
+    extractor = FileExtractorDocument()
+    batches = []
+
+    def _ocr_images(images_data, *args):
+        batches.append(len(images_data))
+        return [f"{size[1]} high" for _, _, size in images_data]
+
+    # Uncached images are read by a single Tesseract run per batch of 50
+    images = ((index, Image.new("L", (8, index), 255)) for index in range(1, 121))
+    with mock.patch.object(extractor_module, "_ocr_images", _ocr_images), \
+            mock.patch.object(extractor_module, "_has_tesserocr", return_value=False):
+        elements = extractor._ocr_images_batch(images, "eng", max_workers=1)
+
+    assert batches == [50, 50, 20]
+    assert [element.content for element in elements[:2]] == ["1 high", "2 high"]
+    assert elements[-1].index == 120
+
+
+def test_ocr_images_tesseract():
+    if TESSERACT is None:
+        raise unittest.SkipTest("tesseract is not installed")
+
+    images_data = []
+    for text in ("FIRST", "SECOND"):
+        image = _text_image(text).resize((1200, 320))
+        images_data.append((image.tobytes(), image.mode, image.size))
+
+    texts = extractor_module._ocr_images(images_data, "eng", 6, 1)
+    assert [text.upper() for text in texts] == ["FIRST", "SECOND"]
+
+
+def test_ocr_image_errors():
+    extractor = FileExtractorDocument()
+    records = _Records(extractor.logger)
+    image = _text_image("error")
+    pytesseract = extractor_module.pytesseract
+
+    # Tesseract errors are raised with their message, in a type any process unpickles
+    error = pytesseract.TesseractError(1, "bad page")
+    with mock.patch.object(extractor_module, "_has_tesserocr", return_value=False), \
+            mock.patch.object(pytesseract, "image_to_string", side_effect=error):
+        try:
+            extractor_module._ocr_image(
+                (image.tobytes(), image.mode, image.size), "eng", 3, 1
+            )
+        except RuntimeError as e:
+            assert "bad page" in str(e)
+        else:
+            raise AssertionError("no error was raised")
+
+    def _ocr_image(image_data, **kwargs):
+        if image_data[2][0] == 200:
+            raise RuntimeError("bad page")
+        return "read"
+
+    # In a batch, the failing image is logged with its index and the others kept
+    images = [(1, _text_image("a")), (2, _text_image("b", (200, 80))), (3, image)]
+    with mock.patch.object(extractor_module, "_ocr_image", _ocr_image), \
+            mock.patch.object(extractor_module, "_has_tesserocr", return_value=True):
+        elements = extractor._ocr_images_batch(images, "eng", max_workers=1)
+
+    assert [element.index for element in elements] == [1, 3]
+    assert "Could not OCR page 2: bad page" in records.messages
+
+
+# PDF PAGES
+
+
+def test_extract_dispatch():
+    extractor = FileExtractorDocument()
+    records = _Records(extractor.logger)
+    tmp_dir = tempfile.mkdtemp()
+
+    methods = mock.Mock()
+    with mock.patch.object(extractor, "_extract_pdf", methods.pdf), \
+            mock.patch.object(extractor, "_extract_other", methods.other):
+        for extension in (".PDF", ".odt", ".xyz"):
+            path = os.path.join(tmp_dir, f"file{extension}")
+            open(path, "w").close()
+            extractor.extract(path)
+
+    # Dispatched by the supported formats, whatever the case of the extension
+    assert [name for name, _, _ in methods.mock_calls] == ["pdf", "other"]
+    assert "Extractor 'document' does not support file '.xyz'." in records.messages
+    shutil.rmtree(tmp_dir)
+
+
+def test_classify_pdf_pages():
+    import pypdfium2 as pdfium
+    from reportlab.pdfgen import canvas
+
+    tmp_dir = tempfile.mkdtemp()
+    image_path = os.path.join(tmp_dir, "scan.png")
+    _text_image("Scanned page", size=(600, 800)).save(image_path)
+    path = os.path.join(tmp_dir, "mixed.pdf")
+    pdf = canvas.Canvas(path)
+    pdf.drawString(72, 760, "Native text of page 1, long enough to be kept.")
+    pdf.showPage()
+    pdf.drawImage(image_path, 0, 0, width=595, height=842)
+    # Whitespace and a page number are no text layer
+    pdf.drawString(72, 40, " " * 40 + "2")
+    pdf.showPage()
+    pdf.save()
+
+    pdf = pdfium.PdfDocument(path)
+    extractor = FileExtractorDocument()
+    assert extractor._classify_pdf_pages(pdf, text_threshold=20) == ([1], [2])
+
+    textpage = pdf[0].get_textpage()
+    assert document_module._pdf_page_has_text(textpage, 20)
+    assert not document_module._pdf_page_has_text(textpage, 1000)
+    textpage.close()
+    pdf.close()
+    shutil.rmtree(tmp_dir)
+
+
+def test_pdf_page_has_paths():
+    import pypdfium2 as pdfium
+    from reportlab.pdfgen import canvas
+
+    tmp_dir = tempfile.mkdtemp()
+    path = os.path.join(tmp_dir, "table.pdf")
+    pdf = canvas.Canvas(path)
+    pdf.drawString(72, 760, "A page of text only")
+    pdf.showPage()
+    # Table borders are drawn as paths
+    pdf.rect(72, 600, 200, 100)
+    pdf.drawString(80, 650, "A cell")
+    pdf.showPage()
+    pdf.save()
+
+    pdf = pdfium.PdfDocument(path)
+    assert [document_module._pdf_page_has_paths(page) for page in pdf] == [False, True]
+    pdf.close()
+    shutil.rmtree(tmp_dir)
+
+
+def test_pdf_render_dpi():
+    import pypdfium2 as pdfium
+
+    tmp_dir = tempfile.mkdtemp()
+    # Images drawn 595 points wide: 1400 pixels are scanned at 169 DPI
+    for image_width, dpi in ((1400, 169), (600, 150), (3000, 200)):
+        path = os.path.join(tmp_dir, f"{image_width}.pdf")
+        _scan_pdf(path, image_width=image_width)
+        pdf = pdfium.PdfDocument(path)
+        assert document_module._pdf_render_dpi(pdf[0], max_dpi=200) == dpi
+        pdf.close()
+    shutil.rmtree(tmp_dir)
+
+
+def test_extract_pdfium_text():
+    import pdfplumber
+    import pypdfium2 as pdfium
+
+    tmp_dir = tempfile.mkdtemp()
+    path = _text_pdf(os.path.join(tmp_dir, "text.pdf"), images=False)
+    extractor = FileExtractorDocument(text_engine="pdfium")
+
+    pdf = pdfium.PdfDocument(path)
+    page = pdf[0]
+    elements = extractor._extract_pdfium_text(page, 1)
+    page.close()
+    pdf.close()
+    # Same lines as read by pdfplumber
+    with pdfplumber.open(path) as plumber_pdf:
+        expected = extractor._extract_pdf_text(plumber_pdf.pages[0], 1)
+    assert [element.content for element in elements] == [
+        element.content for element in expected
+    ]
+    assert "Native text of page 1" in elements[0].content
+
+    # Without any path to detect tables from, pdfplumber is never opened
+    with mock.patch.object(pdfplumber, "open", side_effect=AssertionError("opened")):
+        elements, scan_page_nums = extractor._extract_pdf_native(path, [1])
+    assert scan_page_nums == [] and len(elements) == 1
+    shutil.rmtree(tmp_dir)
+
+
+def test_extract_pdf_pages():
+    tmp_dir = tempfile.mkdtemp()
+    path = _text_pdf(os.path.join(tmp_dir, "text.pdf"), pages=2)
+    config = dict(ocr_lang="eng", text_engine="pdfium")
+
+    elements, scan_page_nums = document_module._extract_pdf_pages(
+        [1, 2], path, 20, config
+    )
+
+    # Only the native text: the embedded images are left to the parent
+    assert scan_page_nums == []
+    assert [element.index for element in elements] == [1, 2]
+    assert "page 2" in elements[1].content
+    assert not any(isinstance(element, ImageElement) for element in elements)
+    shutil.rmtree(tmp_dir)
+
+
+def test_extract_pdf_images_cached():
+    tmp_dir = tempfile.mkdtemp()
+    path = _text_pdf(os.path.join(tmp_dir, "text.pdf"), pages=4)
+    extractor = FileExtractorDocument(max_workers=2)
+    ocr = mock.Mock(side_effect=lambda image_data, **kwargs: "figure")
+
+    # Threads stand in for the processes, so that the patched OCR is shared
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        with mock.patch.object(extractor, "_get_pool", return_value=executor), \
+                mock.patch.object(extractor_module, "_ocr_image", ocr), \
+                mock.patch.object(extractor_module, "_has_tesserocr", return_value=True):
+            first = extractor._extract_pdf(path)
+            second = extractor._extract_pdf(path)
+
+    # The pages were spread over the workers, the figures read once by the parent
+    images = [element for element in first if isinstance(element, ImageElement)]
+    assert [element.index for element in images] == [1, 2, 3, 4]
+    assert ocr.call_count == 4
+    assert len(extractor._ocr_cache) == 4
+    assert [element.content for element in second] == [
+        element.content for element in first
+    ]
+    shutil.rmtree(tmp_dir)
+
+
+def test_ocr_pdf_scans():
+    tmp_dir = tempfile.mkdtemp()
+    path = _scan_pdf(os.path.join(tmp_dir, "scan.pdf"), pages=3)
+    extractor = FileExtractorDocument(max_workers=2, ocr_dpi=100)
+    records = _Records(extractor.logger)
+
+    def _ocr_image(image_data, ocr_lang, ocr_psm, ocr_oem):
+        # Only the page's text goes back, read from its grayscale pixels
+        data, mode, size = image_data
+        assert mode == "L" and len(data) == size[0] * size[1]
+        return f"{size[0]}x{size[1]}"
+
+    # Threads stand in for the processes, each rendering from its own document
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        with mock.patch.object(extractor, "_get_pool", return_value=executor), \
+                mock.patch.object(document_module, "_ocr_image", _ocr_image):
+            elements = extractor._ocr_pdf_scans(path, [1, 3])
+            with mock.patch.object(
+                document_module, "_pdf_render_dpi", side_effect=ValueError("no page")
+            ):
+                failed = extractor._ocr_pdf_scans(path, [2])
+
+    assert [element.index for element in elements] == [1, 3]
+    width, height = elements[0].metadata.image_dims
+    assert elements[0].content == f"{width}x{height}"
+    # A failing page is logged, not raised
+    assert failed == []
+    assert "Could not OCR page 2: no page" in records.messages
+    shutil.rmtree(tmp_dir)
+
+
+def test_iter_pdf_scans_render_ahead():
+    import threading
+    import pypdfium2 as pdfium
+
+    tmp_dir = tempfile.mkdtemp()
+    pdf = pdfium.PdfDocument(_scan_pdf(os.path.join(tmp_dir, "scan.pdf"), pages=3))
+    extractor = FileExtractorDocument(ocr_dpi=100)
+
+    threads = []
+
+    def _render_pdf_page(page, page_num):
+        threads.append(threading.current_thread())
+        return Image.new("L", (8, 8), page_num)
+
+    # Read one at a time with tesserocr: the next page is rendered by a thread
+    with mock.patch.object(extractor, "_render_pdf_page", _render_pdf_page), \
+            mock.patch.object(document_module, "_has_tesserocr", return_value=True):
+        scans = extractor._iter_pdf_scans(pdf, [1, 2, 3], "scan.pdf")
+        scans = [(page_num, image.getpixel((0, 0))) for page_num, image in scans]
+
+    assert scans == [(1, 1), (2, 2), (3, 3)]
+    assert threading.main_thread() not in threads
+    pdf.close()
+    shutil.rmtree(tmp_dir)
+
+
+def test_iter_pdf_scans_sequential():
+    import pypdfium2 as pdfium
+
+    tmp_dir = tempfile.mkdtemp()
+    pdf = pdfium.PdfDocument(_scan_pdf(os.path.join(tmp_dir, "scan.pdf"), pages=3))
+    extractor = FileExtractorDocument()
+
+    # Read by batches without tesserocr: no page is rendered ahead by a thread
+    renderer = mock.Mock(side_effect=AssertionError("rendered ahead"))
+    with mock.patch.object(document_module, "ThreadPoolExecutor", renderer), \
+            mock.patch.object(document_module, "_has_tesserocr", return_value=False):
+        scans = extractor._iter_pdf_scans(pdf, [1, 3], "scan.pdf")
+        assert [(page_num, image.mode) for page_num, image in scans] == [
+            (1, "L"),
+            (3, "L"),
+        ]
+
+    pdf.close()
+    shutil.rmtree(tmp_dir)
+
+
+# IMAGE HELPERS
+
+
+def test_preprocess_image():
+    gray = Image.new("L", (8, 8), 0)
+    assert extractor_module._preprocess_image(gray) is gray
+
+    # Transparent pixels are flattened on white, not left black
+    transparent = Image.new("RGBA", (8, 8), (0, 0, 0, 0))
+    transparent.putpixel((0, 0), (0, 0, 0, 255))
+    image = extractor_module._preprocess_image(transparent)
+    assert image.mode == "L"
+    assert image.getextrema() == (0, 255)
+    assert image.getpixel((1, 1)) == 255
+
+    rgb = Image.new("RGB", (8, 8), (255, 255, 255))
+    assert extractor_module._preprocess_image(rgb).getextrema() == (255, 255)
+
+
+def test_binarize_image():
+    # Two clusters of gray levels, as dark text on a stained page
+    image = Image.new("L", (10, 10), 200)
+    ImageDraw.Draw(image).rectangle((0, 0, 9, 2), fill=60)
+    image.putpixel((9, 9), 190)
+    image.putpixel((0, 9), 70)
+
+    binarized = extractor_module._binarize_image(image)
+    histogram = binarized.histogram()
+    # Only black and white are left, split between the two clusters
+    assert (histogram[0], histogram[255]) == (31, 69)
+    assert binarized.getpixel((0, 9)) == 0
+    assert binarized.getpixel((9, 9)) == 255
+
+
+def test_image_entropy():
+    flat = Image.new("L", (100, 100), 128)
+    # Already at the thumbnail size, so no level is blended by the resize
+    halves = Image.new("L", (64, 64), 0)
+    ImageDraw.Draw(halves).rectangle((0, 0, 63, 31), fill=255)
+    # Black text on a transparent background, which is all black once alpha is dropped
+    transparent = Image.new("RGBA", (64, 64), (0, 0, 0, 0))
+    ImageDraw.Draw(transparent).rectangle((0, 0, 63, 15), fill=(0, 0, 0, 255))
+
+    assert extractor_module._image_entropy(flat) == 0
+    assert extractor_module._image_entropy(halves) == 1.0
+    assert extractor_module._image_entropy(transparent) > 0.2
+
+
+# OCR CACHE
+
+
+def test_ocr_cache_lru():
+    cache = extractor_module._LRUCache(2)
+    cache["a"], cache["b"] = "A", "B"
+    cache["a"]
+    cache["c"] = "C"
+
+    # The least recently used entry is evicted
+    assert list(cache) == ["a", "c"]
+
+
+def test_ocr_cache_persisted():
+    tmp_dir = tempfile.mkdtemp()
+    ocr = mock.Mock(side_effect=lambda image_data, **kwargs: "cached text")
+
+    with mock.patch.object(extractor_module, "_ocr_image", ocr), \
+            mock.patch.object(extractor_module, "_has_tesserocr", return_value=True):
+        with FileExtractorDocument(cache_dir=tmp_dir) as extractor:
+            extractor._ocr_images_batch([(1, _text_image("cached"))], "eng")
+        # Closed on exit, the in-memory fallback is used until entered again
+        assert isinstance(extractor._ocr_cache, extractor_module._LRUCache)
+
+        extractor = FileExtractorDocument(cache_dir=tmp_dir)
+        elements = extractor._ocr_images_batch([(1, _text_image("cached"))], "eng")
+        extractor.close()
+
+    assert ocr.call_count == 1
+    assert elements[0].content == "cached text"
+    shutil.rmtree(tmp_dir)
+
+
+def test_pdf_page_cache():
+    tmp_dir = tempfile.mkdtemp()
+    path = _scan_pdf(os.path.join(tmp_dir, "scan.pdf"), pages=2)
+    extractor = FileExtractorDocument(max_workers=1, ocr_dpi=100)
+    ocr = mock.Mock(side_effect=lambda image_data, **kwargs: "scanned")
+
+    renders = []
+    with mock.patch.object(extractor_module, "_ocr_image", ocr), \
+            mock.patch.object(extractor_module, "_has_tesserocr", return_value=True):
+        for _ in range(2):
+            render = mock.Mock(wraps=extractor._render_pdf_page)
+            with mock.patch.object(extractor, "_render_pdf_page", render):
+                elements = extractor._extract_pdf(path)
+            renders.append(render.call_count)
+
+    # Read pages are neither rendered nor read again
+    assert renders == [2, 0]
+    assert ocr.call_count == 2
+    assert [(element.index, element.content) for element in elements] == [
+        (1, "scanned"),
+        (2, "scanned"),
+    ]
+
+    # Keyed by the file's content and every setting the text depends on
+    keys = extractor._pdf_page_cache_keys(path, [1, 2])
+    extractor.ocr_dpi = 200
+    assert extractor._pdf_page_cache_keys(path, [1, 2])[1] != keys[1]
+    with open(path, "ab") as f:
+        f.write(b"\n")
+    extractor.ocr_dpi = 100
+    assert extractor._pdf_page_cache_keys(path, [1, 2])[1] != keys[1]
+    shutil.rmtree(tmp_dir)
+
+
+def test_pdf_blank_page_cached():
+    from reportlab.pdfgen import canvas
+
+    tmp_dir = tempfile.mkdtemp()
+    image_path = os.path.join(tmp_dir, "scan.png")
+    _text_image("Scanned page", size=(600, 800)).save(image_path)
+    path = os.path.join(tmp_dir, "blank.pdf")
+    pdf = canvas.Canvas(path)
+    pdf.drawImage(image_path, 0, 0, width=595, height=842)
+    pdf.showPage()
+    # Nothing is drawn on the second page
+    pdf.showPage()
+    pdf.save()
+
+    def _ocr_image(image_data, **kwargs):
+        return "" if min(image_data[0]) == 255 else "scanned"
+
+    renders = []
+    with mock.patch.object(extractor_module, "_ocr_image", _ocr_image), \
+            mock.patch.object(extractor_module, "_has_tesserocr", return_value=True):
+        for _ in range(2):
+            with FileExtractorDocument(max_workers=1, cache_dir=tmp_dir) as extractor:
+                render = mock.Mock(wraps=extractor._render_pdf_page)
+                with mock.patch.object(extractor, "_render_pdf_page", render):
+                    elements = extractor._extract_pdf(path)
+            renders.append(render.call_count)
+
+    # The blank page is only rendered once, and never returned
+    assert renders == [2, 0]
+    assert [(element.index, element.content) for element in elements] == [
+        (1, "scanned")
+    ]
+    shutil.rmtree(tmp_dir)
+
+
+# ELEMENTS
+
+
+def test_group_elements():
+    extractor = FileExtractorDocument()
+    sorted_elements = [
+        TextElement(content="hello ", source="native", index=1),
+        ImageElement(content="world", source="ocr", index=1),
+        TextElement(content="An other page", source="native", index=2),
+    ]
+    unsorted_elements = [sorted_elements[2], sorted_elements[0], sorted_elements[1]]
+
+    grouped = extractor._group_elements(sorted_elements, index_type="slide")
+    assert [(element.index, element.content) for element in grouped] == [
+        (1, "SLIDE 1:\n\nhello world"),
+        (2, "SLIDE 2:\n\nAn other page"),
+    ]
+
+    # Unsorted groups are kept in order of first appearance
+    grouped = extractor._group_elements(unsorted_elements, index_type=None)
+    assert [(element.index, element.content) for element in grouped] == [
+        (2, "An other page"),
+        (1, "hello world"),
+    ]
+
+
+def test_save_elements():
+    from pydantic import TypeAdapter
+    from file.src.element import Element
+
+    extractor = FileExtractorDocument()
+    tmp_dir = tempfile.mkdtemp()
+    elements = [
+        TextElement(content="caf\u00e9", source="native", index=1),
+        ImageElement(content="figure", source="ocr", index=2, image_dims=(3, 4)),
+    ]
+
+    # Written as a single UTF-8 JSON document, read back as the same elements
+    extractor._save_elements(tmp_dir, elements, file_name="doc", format="json")
+    with open(os.path.join(tmp_dir, "doc", "elements.json"), "rb") as f:
+        saved = TypeAdapter(list[Element]).validate_json(f.read())
+    assert [element.content for element in saved] == ["caf\u00e9", "figure"]
+
+    # Nothing is written without elements
+    assert extractor._save_elements(tmp_dir, [], file_name="empty", format="json")
+    assert not os.path.exists(os.path.join(tmp_dir, "empty"))
+    shutil.rmtree(tmp_dir)
+
+
+def test_sanitize_text():
+    extractor = FileExtractorDocument()
+    # Short lines go through the cache, long texts don't
+    assert extractor._sanitize_text("\ufeffcafe\u0301") == "caf\u00e9"
+    assert extractor._sanitize_text("\ufeff" + "cafe\u0301" * 100) == "caf\u00e9" * 100
+
+    class _UpperExtractor(FileExtractorDocument):
+        @staticmethod
+        def _sanitize(text: str) -> str:
+            return text.upper()
+
+    # Overrides are used, whatever was cached for the other classes
+    assert _UpperExtractor()._sanitize_text("cafe") == "CAFE"
+    assert extractor._sanitize_text("cafe") == "cafe"
+
+
+# Guarded, as the OCR process pool may re-import this module when spawning workers
+if __name__ == "__main__":
+
+    for name, test in list(globals().items()):
+        if name.startswith("test_") and callable(test):
+            try:
+                test()
+                print(f"{name}: OK")
+            except unittest.SkipTest as e:
+                print(f"{name}: SKIPPED ({e})")